@@ -1,6 +1,7 @@
 import shutil, hashlib
 from pathlib import Path
 import os
+import multiprocessing
 from PySide6.QtCore import QObject, Signal
 import datetime
 from utils import get_base_tokens
@@ -157,4 +158,81 @@ class CopyWorker(QObject):
             if self._sha256(src) != self._sha256(dst):
                 raise ValueError(f"Checksum mismatch: {src}")
             log(f"✓ Verified {dst}")
-        return src_size
\ No newline at end of file
+        return src_size
+
+# ---------- out-of-process engine ----------
+def _run_engine(conn, args, kwargs):
+    """
+    Child-process entry point. Runs a plain CopyWorker and forwards its
+    signals back to the UI process as (event, payload) tuples over `conn`.
+    """
+    worker = CopyWorker(*args, **kwargs)
+    last_pct = [-1]
+
+    def send_progress(pct):
+        # only send when the percentage actually changes, keeps the pipe quiet
+        if pct != last_pct[0]:
+            last_pct[0] = pct
+            conn.send(("progress", pct))
+
+    worker.progress.connect(send_progress)
+    worker.done.connect(lambda: conn.send(("done", None)))
+    worker.error.connect(lambda m: conn.send(("error", m)))
+    try:
+        worker.run()
+    finally:
+        conn.close()
+
+
+class ProcessCopyWorker(QObject):
+    """
+    Same interface as CopyWorker, but the copy / hash work happens in a
+    child process. `run()` only relays events from the pipe, so the GUI
+    process never holds the GIL for byte moving and a crash in the engine
+    surfaces as `error(str)` instead of taking the UI down.
+    """
+    progress = Signal(int)
+    done     = Signal()
+    error    = Signal(str)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._args = args
+        self._kwargs = kwargs
+
+    def run(self):
+        # "spawn" on every platform so the child never inherits Qt state
+        ctx = multiprocessing.get_context("spawn")
+        recv_conn, send_conn = ctx.Pipe(duplex=False)
+        proc = ctx.Process(target=_run_engine,
+                           args=(send_conn, self._args, self._kwargs),
+                           daemon=True)
+        try:
+            proc.start()
+        except Exception as ex:
+            self.error.emit(str(ex))
+            return
+        send_conn.close()  # child owns the write end now
+
+        finished = False
+        try:
+            while True:
+                try:
+                    event, payload = recv_conn.recv()
+                except EOFError:
+                    break
+                if event == "progress":
+                    self.progress.emit(payload)
+                elif event == "done":
+                    finished = True
+                    self.done.emit()
+                elif event == "error":
+                    finished = True
+                    self.error.emit(payload)
+        finally:
+            recv_conn.close()
+            proc.join()
+
+        if not finished:
+            log(f"Copy engine exited unexpectedly (exit code {proc.exitcode})")
+            self.error.emit(f"Copy engine exited unexpectedly (exit code {proc.exitcode})")
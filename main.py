@@ -3,7 +3,8 @@ from pathlib import Path
 import psutil
 import os
 import json
-from copyWorker import CopyWorker
+from copyWorker import CopyWorker, ProcessCopyWorker
+import multiprocessing
 import string
 import re
 from utils import get_base_token_keys, clean_unmatched_braces
@@ -202,6 +203,7 @@ class Ditz_ui(QWidget):
         bottom.setContentsMargins(10, 6, 10, 10)
 
         self.verify_chk = QCheckBox("Verify checksum (SHA-256)")
+        self.process_chk = QCheckBox("Run ingest in separate process")
         self.go_btn = QPushButton("Ingest Files", clicked=self._start_copy)
         self.go_btn.setEnabled(False)
         self.pb = QProgressBar()
@@ -209,6 +211,7 @@ class Ditz_ui(QWidget):
         
 
         bottom.addWidget(self.verify_chk)
+        bottom.addWidget(self.process_chk)
         bottom.addStretch()
         bottom.addWidget(self.go_btn)
         bottom.addWidget(self.pb, 2)
@@ -397,7 +400,8 @@ class Ditz_ui(QWidget):
         self.pb.setValue(0); self.go_btn.setEnabled(False)
 
         self.thread = QThread()
-        self.worker = CopyWorker(
+        worker_cls = ProcessCopyWorker if self.process_chk.isChecked() else CopyWorker
+        self.worker = worker_cls(
             self.input_list.paths(),
             self.output_list.paths(),
             self.verify_chk.isChecked(),
@@ -445,6 +449,7 @@ class Ditz_ui(QWidget):
 
 # ─────────────── app entry ───────────────
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # needed for frozen (pyinstaller) builds
     app = QApplication(sys.argv)
     scale = QGuiApplication.primaryScreen().devicePixelRatio()
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)